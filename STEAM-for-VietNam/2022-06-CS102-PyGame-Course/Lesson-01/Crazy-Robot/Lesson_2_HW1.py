@@ -50,18 +50,24 @@ while running:
 
         for item in list_item:
             if not item.hidden:
-                if overlap(player.x, player.y, player.image, item.x, item.y, item.image):
+                if overlap(
+                        player.x, player.y, player.w, player.h, player.mask,
+                        item.x, item.y, item.w, item.h, item.mask):
                     item.set_hidden()
                     # Increase Score
                     new_score: int = game_state.score + 1
                     game_state.update_score(new_score)
 
         for robot in list_robot:
-            if overlap(player.x, player.y, player.image, robot.x, robot.y, robot.image):
+            if overlap(
+                    player.x, player.y, player.w, player.h, player.mask,
+                    robot.x, robot.y, robot.w, robot.h, robot.mask):
                 print("YOU LOST!!")
                 game_state.update_state(GameStateType.LOST)
 
-        if overlap(player.x, player.y, player.image, to_mo.x, to_mo.y, to_mo.image):
+        if overlap(
+                player.x, player.y, player.w, player.h, player.mask,
+                to_mo.x, to_mo.y, to_mo.w, to_mo.h, to_mo.mask):
             print("YOU WON!!")
             game_state.update_state(GameStateType.WON)
 
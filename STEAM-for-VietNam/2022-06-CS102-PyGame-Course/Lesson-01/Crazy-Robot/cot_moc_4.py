@@ -1,5 +1,7 @@
-from typing import List
+import gc
+from typing import Any, Dict, List, Tuple
 import pygame
+from pygame import Rect, Surface
 from common import (
     ROBOT_SPRITE, TO_MO_SPRITE, PLAYER_SPRITE,
     WHITE, BACKGROUND_SPRITE, FPS, screen, clock
@@ -8,7 +10,7 @@ from entities import (
     Player, Robot,
     GameItem, ItemType, NPC, GameState, GameStateType,
 )
-from utils import overlap
+from spatial_hash import SpatialHashGrid
 
 
 # Game States:
@@ -32,61 +34,180 @@ list_item: List[GameItem] = [
     GameItem(500, 400, ItemType.DIAMOND_RED),
 ]
 
+# Các vật phẩm chưa được nhặt
+active_items: List[GameItem] = list(list_item)
+
 to_mo: NPC = NPC(1000, 50, TO_MO_SPRITE)
 
+# Danh sách (hình, vị trí) để vẽ Robot và vật phẩm bằng screen.blits(), tạo 1 lần trước game
+# và dùng lại mỗi frame thay vì tạo danh sách mới:
+# - Robot di chuyển, nên mỗi frame chỉ cập nhật lại toạ độ của Rect tương ứng,
+# - vật phẩm đứng yên, chỉ bị xoá khỏi danh sách khi được nhặt.
+robot_blit_dests: List[Tuple[Robot, Rect]] = [
+    (robot, Rect(robot.x, robot.y, robot.w, robot.h)) for robot in list_robot
+]
+item_blit_entries: Dict[GameItem, Tuple[Surface, Tuple[int, int]]] = {
+    item: (item.image, (item.x, item.y)) for item in list_item
+}
+blit_sequence: List[Tuple[Surface, Any]] = [
+    (robot.image, dest) for robot, dest in robot_blit_dests
+]
+blit_sequence += item_blit_entries.values()
+
+
+def on_item_hidden(item: GameItem) -> None:
+    # Vật phẩm tự xoá mình khỏi các danh sách trên khi bị ẩn đi
+    active_items.remove(item)
+    blit_sequence.remove(item_blit_entries[item])
+
+
+for item in list_item:
+    item.on_hidden = on_item_hidden
+
+# Lưới chia ô để tìm nhanh các vật thể ở gần Player, mỗi ô ~ 2 lần kích thước Robot
+grid: SpatialHashGrid = SpatialHashGrid(cell_size=2 * max(ROBOT_SPRITE.get_size()))
+
 # Bắt đầu game
 game_state: GameState = GameState(score=0)
 
+# Ghép sẵn màu nền trắng và hình nền thành 1 hình duy nhất, vẽ 1 lần lên toàn màn hình.
+# Sau đó mỗi frame chỉ vẽ lại hình nền ở những vùng có vật thể (dirty rects),
+# thay vì tô lại toàn bộ màn hình.
+background: Surface = Surface(screen.get_size()).convert()
+background.fill(WHITE)
+background.blit(BACKGROUND_SPRITE, (0, 0))
+screen.blit(background, (0, 0))
+pygame.display.flip()
+
+# Các vùng màn hình đã vẽ vật thể ở frame trước
+prev_rects: List[Rect] = []
+
+# Gán trước các hàm và hằng số dùng trong mỗi frame vào biến,
+# để vòng lặp game không phải tra cứu lại thuộc tính (vd. pygame.event.get) mỗi lần.
+get_events = pygame.event.get
+QUIT = pygame.QUIT
+WINDOWEXPOSED = pygame.WINDOWEXPOSED
+RUNNING = GameStateType.RUNNING
+screen_blit = screen.blit
+screen_blits = screen.blits
+display_update = pygame.display.update
+display_flip = pygame.display.flip
+clock_tick = clock.tick
+player_update = player.update
+robot_updates = [robot.update for robot in list_robot]
+grid_insert = grid.insert
+player_mask_overlap = player.mask.overlap
+
+# Chỉ nhận các sự kiện game cần đến, SDL sẽ bỏ qua các sự kiện khác (vd. di chuột)
+# thay vì đưa vào hàng đợi. Trạng thái bàn phím cho pygame.key.get_pressed() vẫn được cập nhật.
+# WINDOWEXPOSED cần để biết khi nào phải vẽ lại cả màn hình.
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([QUIT, WINDOWEXPOSED, pygame.KEYDOWN, pygame.KEYUP])
+
+# Dọn rác 1 lần sau khi đã tạo xong mọi vật thể, rồi "đóng băng" (freeze) chúng để bộ dọn rác (GC)
+# không phải duyệt lại chúng nữa. Trong lúc chơi, tắt GC tự động và tự gọi dọn ở cuối mỗi frame,
+# tránh việc GC chạy bất chợt giữa frame làm game bị giật:
+# - mỗi frame dọn thế hệ 0 (các đối tượng mới tạo),
+# - thỉnh thoảng dọn thêm thế hệ 1 và 2, nơi chứa các đối tượng đã sống sót qua
+#   các lần dọn trước.
+GC_GEN1_INTERVAL: int = FPS  # số frame giữa 2 lần dọn thế hệ 1, ~ 1 giây
+GC_GEN2_INTERVAL: int = 10 * FPS  # số frame giữa 2 lần dọn toàn bộ, ~ 10 giây
+gc.collect()
+gc.freeze()
+gc.disable()
+gc_collect = gc.collect
+frame_count: int = 0
+
 running: bool = True
 while running:
-    # Người chơi có tắt màn hình game chưa
-    if pygame.event.peek(pygame.QUIT):
-        running = False
+    # Lấy (và xoá) tất cả sự kiện trong hàng đợi, chỉ 1 lần mỗi frame
+    events = get_events()
+
+    # Người chơi có tắt màn hình game chưa.
+    # Cửa sổ game vừa được hiện lại (vd. sau khi bị che hoặc thu nhỏ) thì phải vẽ lại cả màn hình.
+    is_exposed: bool = False
+    for event in events:
+        if event.type == QUIT:
+            running = False
+            break
+        if event.type == WINDOWEXPOSED:
+            is_exposed = True
+    if not running:
         break
 
     # ----------------------------------------
-    if game_state.state == GameStateType.RUNNING:
-        player.update()
+    if game_state.state == RUNNING:
+        player_update()
 
-        for robot in list_robot:
-            robot.update()
-
-        for item in list_item:
-            if not item.hidden:
-                if overlap(player.x, player.y, player.image, item.x, item.y, item.image):
-                    item.set_hidden()
-                    # Increase Score
-                    new_score: int = game_state.score + 1
-                    game_state.update_score(new_score)
+        for robot_update in robot_updates:
+            robot_update()
 
+        # Ghi lại vị trí các vật thể có thể va chạm với Player vào lưới
+        grid.clear()
+        for item in active_items:
+            grid_insert(item, item.x, item.y, item.w, item.h)
         for robot in list_robot:
-            if overlap(player.x, player.y, player.image, robot.x, robot.y, robot.image):
+            grid_insert(robot, robot.x, robot.y, robot.w, robot.h)
+        grid_insert(to_mo, to_mo.x, to_mo.y, to_mo.w, to_mo.h)
+
+        # Chỉ kiểm tra va chạm với các vật thể ở gần Player.
+        # grid.query() đã loại các vật thể có hình chữ nhật bao quanh không chạm Player,
+        # nên chỉ còn so sánh mask, bằng 1 lần gọi hàm C Mask.overlap() cho mỗi vật thể.
+        player_x = player.x
+        player_y = player.y
+        for entity in grid.query(player_x, player_y, player.w, player.h):
+            offset = (entity.x - player_x, entity.y - player_y)
+            if player_mask_overlap(entity.mask, offset) is None:
+                continue
+
+            if isinstance(entity, GameItem):
+                entity.set_hidden()
+                # Increase Score
+                new_score: int = game_state.score + 1
+                game_state.update_score(new_score)
+            elif isinstance(entity, Robot):
                 print("YOU LOST!!")
                 game_state.update_state(GameStateType.LOST)
-
-        if overlap(player.x, player.y, player.image, to_mo.x, to_mo.y, to_mo.image):
-            print("YOU WON!!")
-            game_state.update_state(GameStateType.WON)
+            elif entity is to_mo:
+                print("YOU WON!!")
+                game_state.update_state(GameStateType.WON)
 
     # ----------------------------------------
     # Vẽ các vật phẩm game
-    screen.fill(WHITE)
-    screen.blit(BACKGROUND_SPRITE, (0, 0))
-
-    player.render(screen)
-
-    for robot in list_robot:
-        robot.render(screen)
-
-    for item in list_item:
-        item.render(screen)
-
-    to_mo.render(screen)
-
-    game_state.render(screen)
-
-    pygame.display.flip()
-    clock.tick(FPS)
+    if is_exposed:
+        screen_blit(background, (0, 0))
+    else:
+        # Xoá các vật thể ở frame trước bằng cách vẽ lại hình nền tại đúng các vùng đó
+        screen_blits([(background, rect, rect) for rect in prev_rects], doreturn=False)
+
+    curr_rects: List[Rect] = [player.render(screen)]
+
+    # Vẽ tất cả Robot và vật phẩm với 1 lần gọi screen.blits(), thay vì gọi blit() cho từng cái
+    for robot, dest in robot_blit_dests:
+        dest.x = robot.x
+        dest.y = robot.y
+    curr_rects += screen_blits(blit_sequence)
+
+    curr_rects.append(to_mo.render(screen))
+
+    curr_rects += game_state.render(screen)
+
+    if is_exposed:
+        display_flip()
+    else:
+        # Chỉ cập nhật lên màn hình các vùng bị xoá và các vùng vừa vẽ, thay vì cả màn hình
+        display_update(prev_rects + curr_rects)
+    prev_rects = curr_rects
+    clock_tick(FPS)
+
+    frame_count += 1
+    if frame_count % GC_GEN2_INTERVAL == 0:
+        gc_collect(2)
+    elif frame_count % GC_GEN1_INTERVAL == 0:
+        gc_collect(1)
+    else:
+        gc_collect(0)
 
 # Ket thuc game
+gc.enable()
 pygame.quit()
@@ -1,6 +1,7 @@
 import enum
+from typing import Callable, List, Optional
 import pygame
-from pygame import Surface
+from pygame import Rect, Surface
 from common import (
     SCREEN_HEIGHT,
     SCREEN_WIDTH, RED,
@@ -10,23 +11,33 @@ from common import (
 
 
 class BaseEntity:
+    # __slots__ liệt kê trước các thuộc tính của đối tượng, giúp tiết kiệm bộ nhớ
+    # và truy cập thuộc tính nhanh hơn
+    __slots__ = ("x", "y", "image", "w", "h", "mask")
+
     def __init__(self, x: int, y: int, image: Surface) -> None:
         self.x: int = x
         self.y: int = y
         self.image = image
+        # Kích thước và mask của hình không đổi, nên chỉ tính 1 lần
+        self.w, self.h = image.get_size()
+        self.mask = pygame.mask.from_surface(image)
 
-    def render(self, screen: Surface) -> None:
-        screen.blit(self.image, (self.x, self.y))
+    def render(self, screen: Surface) -> Rect:
+        # Trả về vùng màn hình vừa được vẽ, dùng để chỉ cập nhật lại vùng đó
+        return screen.blit(self.image, (self.x, self.y))
 
 
 class Player(BaseEntity):
+    __slots__ = ()
+
     def _move(self, dx: int, dy: int):
         new_x = self.x + dx
         new_y = self.y + dy
 
-        if 0 < new_x < SCREEN_WIDTH - self.image.get_width():
+        if 0 < new_x < SCREEN_WIDTH - self.w:
             self.x = new_x
-        if 0 < new_y < SCREEN_HEIGHT - self.image.get_height():
+        if 0 < new_y < SCREEN_HEIGHT - self.h:
             self.y = new_y
 
     def update(self) -> None:
@@ -42,28 +53,29 @@ class Player(BaseEntity):
 
 
 class Robot(BaseEntity):
+    __slots__ = ("x_heading", "y_heading", "max_x", "max_y")
+
     def __init__(
             self, x: float, y: float, x_heading: float, y_heading: float, image: Surface) -> None:
         super().__init__(x, y, image)
         self.x_heading: float = x_heading
         self.y_heading: float = y_heading
+        # Vị trí lớn nhất Robot có thể đi tới mà không ra khỏi màn hình, chỉ tính 1 lần
+        self.max_x: int = SCREEN_WIDTH - self.w
+        self.max_y: int = SCREEN_HEIGHT - self.h
 
     def update(self):
-        self.x = self.x + self.x_heading
-        self.y = self.y + self.y_heading
+        self.x += self.x_heading
+        self.y += self.y_heading
 
-        if self.x > SCREEN_WIDTH - self.image.get_width():
+        if self.x < 0 or self.x > self.max_x:
             self.x_heading = -self.x_heading
-        if self.x < 0:
-            self.x_heading = -self.x_heading
-        if self.y > SCREEN_HEIGHT - self.image.get_height():
-            self.y_heading = -self.y_heading
-        if self.y < 0:
+        if self.y < 0 or self.y > self.max_y:
             self.y_heading = -self.y_heading
 
 
 class NPC(BaseEntity):
-    ...
+    __slots__ = ()
 
 
 class ItemType(enum.Enum):
@@ -72,6 +84,8 @@ class ItemType(enum.Enum):
 
 
 class GameItem:
+    __slots__ = ("x", "y", "image", "type", "name", "hidden", "on_hidden", "w", "h", "mask")
+
     def __init__(self, x: float, y: float, type: ItemType) -> None:
         self.x: float = x
         self.y: float = y
@@ -79,6 +93,8 @@ class GameItem:
         self.type = type
         self.name: str
         self.hidden = False
+        # Hàm được gọi khi vật phẩm bị ẩn đi (đã được nhặt), nếu có
+        self.on_hidden: Optional[Callable[["GameItem"], None]] = None
 
         if type == ItemType.DIAMOND_BLUE:
             self.name = "Kim Cuong Xanh"
@@ -87,12 +103,18 @@ class GameItem:
             self.name = "Kim Cuong Do"
             self.image = DIAMOND_RED_SPRITE
 
+        self.w, self.h = self.image.get_size()
+        self.mask = pygame.mask.from_surface(self.image)
+
     def set_hidden(self):
         self.hidden = True
+        if self.on_hidden:
+            self.on_hidden(self)
 
-    def render(self, screen: Surface) -> None:
+    def render(self, screen: Surface) -> Optional[Rect]:
         if not self.hidden:
-            screen.blit(self.image, (self.x, self.y))
+            return screen.blit(self.image, (self.x, self.y))
+        return None
 
 
 class GameState:
@@ -121,10 +143,12 @@ class GameState:
         self.score = score
         self.score_text: Surface = FREESANSBOLD_24.render(f"Score: {score}", True, BLUE)
 
-    def render(self, screen: Surface) -> None:
+    def render(self, screen: Surface) -> List[Rect]:
+        drawn_rects: List[Rect] = []
+
         # Score Text Render on Top Left Corner
         if self.score_text:
-            screen.blit(self.score_text, (10, 10))
+            drawn_rects.append(screen.blit(self.score_text, (10, 10)))
 
         # Status Text Render in Middle of Screen
         if self.status_text:
@@ -133,4 +157,6 @@ class GameState:
                 SCREEN_HEIGHT // 2 - self.status_text.get_height() // 2,
             )
 
-            screen.blit(self.status_text, position)
+            drawn_rects.append(screen.blit(self.status_text, position))
+
+        return drawn_rects
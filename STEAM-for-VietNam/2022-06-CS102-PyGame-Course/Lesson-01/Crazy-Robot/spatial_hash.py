@@ -0,0 +1,90 @@
+from typing import Any, Dict, List, Set, Tuple
+
+from pygame.rect import Rect
+
+
+class SpatialHashGrid:
+    """
+    Uniform grid that buckets entities by the screen cells they cover, so collision checks
+    only look at entities near the Player instead of the whole entity list.
+
+    With few entities (below BRUTE_FORCE_THRESHOLD) bucketing does not pay off,
+    so query() tests the box against every inserted item at once, and the buckets are
+    only built (by the first query() after clear()) once there are enough items.
+
+    insert() and query() can be called in any order: items inserted after the buckets
+    are built are added to their buckets right away.
+    """
+
+    BRUTE_FORCE_THRESHOLD: int = 32
+
+    # 2 số nguyên tố lớn để trộn toạ độ ô thành 1 khoá (key) cho bucket
+    PRIME_X: int = 73856093
+    PRIME_Y: int = 19349663
+
+    def __init__(self, cell_size: int) -> None:
+        self.cell_size: int = cell_size
+        # 2 danh sách song song: vật thể thứ i có hình chữ nhật bao quanh là boxes[i]
+        self.items: List[Any] = []
+        self.boxes: List[Tuple[float, float, int, int]] = []
+        # Các bucket chứa chỉ số (index) của vật thể, được giữ lại giữa các frame,
+        # mỗi frame chỉ list.clear() chúng
+        self.buckets: Dict[int, List[int]] = {}
+        self.is_bucketed: bool = False
+
+    def _cell_key(self, cx: int, cy: int) -> int:
+        return (cx * self.PRIME_X) ^ (cy * self.PRIME_Y)
+
+    def clear(self) -> None:
+        self.items.clear()
+        self.boxes.clear()
+        if self.is_bucketed:
+            for bucket in self.buckets.values():
+                bucket.clear()
+            self.is_bucketed = False
+
+    def insert(self, item: Any, x: float, y: float, w: int, h: int) -> None:
+        self.items.append(item)
+        self.boxes.append((x, y, w, h))
+        if self.is_bucketed:
+            self._add_to_buckets(len(self.items) - 1, x, y, w, h)
+
+    def _add_to_buckets(self, index: int, x: float, y: float, w: int, h: int) -> None:
+        cell_size = self.cell_size
+        buckets = self.buckets
+        for cx in range(int(x // cell_size), int((x + w) // cell_size) + 1):
+            for cy in range(int(y // cell_size), int((y + h) // cell_size) + 1):
+                key = self._cell_key(cx, cy)
+                bucket = buckets.get(key)
+                if bucket is None:
+                    bucket = buckets[key] = []
+                bucket.append(index)
+
+    def _build_buckets(self) -> None:
+        for index, (x, y, w, h) in enumerate(self.boxes):
+            self._add_to_buckets(index, x, y, w, h)
+        self.is_bucketed = True
+
+    def query(self, x: float, y: float, w: int, h: int) -> List[Any]:
+        """
+        Returns the items whose bounding box overlaps the box (x, y, w, h),
+        in insertion order, each item at most once.
+        """
+        query_rect = Rect(x, y, w, h)
+        if len(self.items) < self.BRUTE_FORCE_THRESHOLD:
+            # Rect.collidelistall() kiểm tra tất cả hình chữ nhật trong 1 lần gọi (viết bằng C)
+            return [self.items[i] for i in query_rect.collidelistall(self.boxes)]
+
+        if not self.is_bucketed:
+            self._build_buckets()
+
+        cell_size = self.cell_size
+        candidate_indices: Set[int] = set()
+        for cx in range(int(x // cell_size), int((x + w) // cell_size) + 1):
+            for cy in range(int(y // cell_size), int((y + h) // cell_size) + 1):
+                candidate_indices.update(self.buckets.get(self._cell_key(cx, cy), ()))
+        return [
+            self.items[i]
+            for i in sorted(candidate_indices)
+            if query_rect.colliderect(self.boxes[i])
+        ]
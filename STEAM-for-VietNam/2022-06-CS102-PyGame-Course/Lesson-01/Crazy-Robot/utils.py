@@ -1,4 +1,5 @@
 from typing import Tuple
+from pygame.mask import Mask
 from pygame.surface import Surface
 import pygame
 
@@ -14,10 +15,14 @@ def scale_image(image: Surface, scale: float) -> Surface:
 
 
 # Hàm hỗ trợ
-def overlap(x1: float, y1: float, image1: Surface, x2: float, y2: float, image2: Surface) -> bool:
+def overlap(
+        x1: float, y1: float, w1: int, h1: int, mask1: Mask,
+        x2: float, y2: float, w2: int, h2: int, mask2: Mask) -> bool:
     """Returns True if 2 items overlap."""
-    mask1 = pygame.mask.from_surface(image1)
-    mask2 = pygame.mask.from_surface(image2)
+    # Hai hình chữ nhật bao quanh không chạm nhau thì chắc chắn không va chạm,
+    # khi đó không cần so sánh từng điểm ảnh (mask) tốn thời gian hơn.
+    if not (x1 < x2 + w2 and x2 < x1 + w1 and y1 < y2 + h2 and y2 < y1 + h1):
+        return False
     offset_x = x2 - x1
     offset_y = y2 - y1
     return bool(mask1.overlap(mask2, (offset_x, offset_y)))
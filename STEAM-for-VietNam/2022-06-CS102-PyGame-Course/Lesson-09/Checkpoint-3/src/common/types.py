@@ -45,6 +45,7 @@ FRIENDLY_NPC_TYPES = (EntityType.NPC_CO_NGA, EntityType.NPC_CHU_NAM, EntityType.
 TRAMPOLINE_PART_TYPES = (EntityType.TRAMPOLINE_PART_SPRING, EntityType.TRAMPOLINE_PART_FRAME)
 COLLECTABLE_TYPES = (EntityType.HEART, EntityType.CANDY) + TRAMPOLINE_PART_TYPES
 FIXED_POSITION_TYPES = (EntityType.DIALOGUE_BOX, EntityType.PLAYER_HP, EntityType.PLAYER_INVENTORY)
+POOLED_TYPES = (EntityType.QUESTION_MARK, EntityType.DIALOGUE_BOX)
 
 
 class QuestName(enum.Enum):
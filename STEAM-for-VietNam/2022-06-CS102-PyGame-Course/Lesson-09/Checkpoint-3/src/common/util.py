@@ -31,6 +31,15 @@ def get_font(font_size):
     return Font(FONT_PATH, font_size)
 
 
+@functools.lru_cache(maxsize=256)
+def flip_image_x(image: Surface) -> Surface:
+    """
+    Flipping creates a new Surface every call, while the same few sprites get flipped
+    every tick, so we cache the flipped versions.
+    """
+    return pygame.transform.flip(image, True, False)
+
+
 def scale_image(image: Surface, scale: Optional[Union[float, Tuple[int, int]]] = None):
     if scale is None or scale == 1.0:
         return image
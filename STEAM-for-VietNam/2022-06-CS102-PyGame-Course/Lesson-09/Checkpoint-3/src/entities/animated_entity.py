@@ -19,6 +19,8 @@ logger = util.get_logger(__name__)
 
 
 class AnimatedEntity(MovableEntity):
+    __slots__ = ("sprites", "sprite_index", "action")
+
     def __init__(
         self,
         sprite_path: Path,
@@ -107,7 +109,9 @@ class AnimatedEntity(MovableEntity):
             for image_file in sprite_subdir.iterdir():
                 if image_file.name.startswith(".") or not image_file.is_file():
                     continue
-                image = pygame.image.load(str(image_file))
+                # call .convert_alpha() to convert to the screen's pixel format once at load time,
+                # instead of on every blit.
+                image = pygame.image.load(str(image_file)).convert_alpha()
                 action_sprites.append(util.scale_image(image, scale))
                 cnt += 1
 
@@ -121,6 +125,8 @@ class PropEntity(AnimatedEntity):
     Various items in the game that does not move / jump, but still needs animation.
     """
 
+    __slots__ = ()
+
     def _update_action(self):
         """
         This special entity does not have actions such as jump,
@@ -22,6 +22,22 @@ class BaseEntity:
     Most game entities will be objects of the child classes instead of using this class directly.
     """
 
+    __slots__ = (
+        "id",
+        "entity_type",
+        "created_at",
+        "ttl_ms",
+        "active",
+        "events",
+        "world",
+        "sprite_path",
+        "scale",
+        "visible",
+        "flip_x",
+        "image",
+        "rect",
+    )
+
     gen_id = itertools.count()
 
     def __init__(
@@ -51,7 +67,9 @@ class BaseEntity:
         self.flip_x: bool = False
 
         if self.sprite_path and self.sprite_path.exists():
-            self.image = util.scale_image(pygame.image.load(self.sprite_path), self.scale)
+            self.image = util.scale_image(
+                pygame.image.load(self.sprite_path).convert_alpha(), self.scale
+            )
             self.rect: Rect = self.image.get_rect()
             self.rect.x, self.rect.y = x, y
 
@@ -64,6 +82,10 @@ class BaseEntity:
         return self.rect.width
 
     def collide(self, other: BaseEntity):
+        # Pixel-perfect collide_mask() builds both masks from the images on every call,
+        # so first rule out the (most common) case where the bounding rects do not even touch.
+        if not self.rect.colliderect(other.rect):
+            return None
         return collide_mask(self, other)
 
     def update(self, events: Sequence[GameEvent], world: World):
@@ -86,6 +108,9 @@ class BaseEntity:
         Schedules the despawn of this entity.
         """
         self.ttl_ms = remaining_ttl_ms + pygame.time.get_ticks() - self.created_at
+        # World skips update() of static entities, make sure this one gets updated to despawn.
+        if self.world is not None:
+            self.world.set_updatable(self)
 
     def set_visible(self, visible: bool) -> None:
         self.visible = visible
@@ -120,6 +145,10 @@ class BaseEntity:
         image = util.scale_image(self.image, scale)
 
         if self.flip_x:
-            image = pygame.transform.flip(image, True, False)
+            if scale is None:
+                # Same sprite as last tick, reuse its cached flipped version.
+                image = util.flip_image_x(image)
+            else:
+                image = pygame.transform.flip(image, True, False)
 
         screen.blit(image, x_y)
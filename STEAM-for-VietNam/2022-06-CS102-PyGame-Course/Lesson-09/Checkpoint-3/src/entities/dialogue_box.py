@@ -8,6 +8,8 @@ class DialogueBox(BaseEntity):
     Dialogue box appears at fixed position at bottom of the screen.
     """
 
+    __slots__ = ("text",)
+
     def set_text(self, text):
         self.text = text
 
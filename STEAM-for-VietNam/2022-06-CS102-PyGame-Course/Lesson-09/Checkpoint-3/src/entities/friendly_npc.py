@@ -20,6 +20,17 @@ class FriendlyNpc(AnimatedEntity):
     Non-playable character, will talk and interact with Player.
     """
 
+    __slots__ = (
+        "npc_config",
+        "is_near_player",
+        "question_mark_id",
+        "dialogue_box_id",
+        "dialogues",
+        "dialogue_index",
+        "line_index",
+        "should_loop_last_dialogue",
+    )
+
     def __init__(self, npc_config, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -49,7 +60,7 @@ class FriendlyNpc(AnimatedEntity):
         if self.has_dialogue() and self.is_near_player:
             self._highlight()
         else:
-            self._unhightlight()
+            self._unhighlight()
 
     def has_dialogue(self) -> bool:
         if not self.should_loop_last_dialogue:
@@ -63,10 +74,8 @@ class FriendlyNpc(AnimatedEntity):
 
     def _handle_events(self):
         self.is_near_player = False
-        for event in self.events:
-            # Handle events specifically sent to this NPC
-            if not event.get_listener_id() == self.id:
-                continue
+        # Handle events specifically sent to this NPC
+        for event in self.world.get_events_for(self.id):
             if event.is_type(EventType.PLAYER_NEAR_NPC):
                 self.is_near_player = True
             elif event.is_type(EventType.PLAYER_ACTIVATE_NPC):
@@ -79,14 +88,14 @@ class FriendlyNpc(AnimatedEntity):
                 self.dialogues = []
 
     def _highlight(self):
-        if not self.question_mark_id:
+        if self.question_mark_id is None:
             self.question_mark_id = self.world.add_entity(EntityType.QUESTION_MARK)
             new_entity = self.world.get_entity(self.question_mark_id)
             new_entity.rect.centerx = self.rect.centerx
             new_entity.rect.y = self.rect.y - 80
 
-    def _unhightlight(self):
-        if self.question_mark_id:
+    def _unhighlight(self):
+        if self.question_mark_id is not None:
             self.world.remove_entity(self.question_mark_id)
             self.question_mark_id = None
 
@@ -97,13 +106,13 @@ class FriendlyNpc(AnimatedEntity):
         next_dialogue_item = self._get_next_dialogue_item()
         if not next_dialogue_item:
             GameEvent(EventType.NPC_DIALOGUE_END, sender_id=self.id).post()
-            if self.dialogue_box_id:
+            if self.dialogue_box_id is not None:
                 self.world.remove_entity(self.dialogue_box_id)
                 self.dialogue_box_id = None
             return
 
         next_line = "\n".join((next_dialogue_item["Subject"], next_dialogue_item["Line"]))
-        if not self.dialogue_box_id:
+        if self.dialogue_box_id is None:
             self.dialogue_box_id = self.world.add_entity(EntityType.DIALOGUE_BOX)
         dialogue_box: DialogueBox = self.world.get_entity(self.dialogue_box_id)
         dialogue_box.set_text(next_line)
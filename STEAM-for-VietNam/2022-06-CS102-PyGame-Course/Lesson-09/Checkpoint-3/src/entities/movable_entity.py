@@ -15,6 +15,21 @@ logger = util.get_logger(__name__)
 
 
 class MovableEntity(BaseEntity):
+    __slots__ = (
+        "gravity",
+        "speed",
+        "jump_vertical_speed",
+        "jump_with_trampoline_speed",
+        "dx",
+        "dy",
+        "moving_left",
+        "moving_right",
+        "is_landed",
+        "is_dying",
+        "animation_interval_ms",
+        "last_animation_ms",
+    )
+
     def __init__(
         self,
         animation_interval_ms: int = 80,
@@ -122,6 +137,8 @@ class MovableEntity(BaseEntity):
         # whether the subject is_landed, so we first reset it.
         self.is_landed = False
         for obstacle in obstacles:
+            if not obstacle.is_active():
+                continue
             if obstacle.rect.colliderect(
                 self.rect.x + self.dx,
                 self.rect.y,
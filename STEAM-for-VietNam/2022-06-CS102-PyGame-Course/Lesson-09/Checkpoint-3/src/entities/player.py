@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence
 
 import pygame
+from pygame.surface import Surface
 
 from common import util
 from common.event import EventType, GameEvent
@@ -22,12 +23,32 @@ class Player(AnimatedEntity):
     The main character controlled by user, can talk / fight NPCs, can interact with in-game objects.
     """
 
+    __slots__ = (
+        "npc_near_by",
+        "talking",
+        "inventory",
+        "inventory_images",
+        "inventory_entity_id",
+        "is_inventory_changed",
+        "last_hit_t",
+    )
+
+    # Screen edges used by _update_screen_offset() every tick, computed once.
+    RIGHT_EDGE: int = GameConfig.WIDTH
+    RIGHT_SOFT_EDGE: int = GameConfig.WIDTH - GameConfig.PLAYER_SOFT_EDGE_WIDTH
+    LEFT_SOFT_EDGE: int = GameConfig.PLAYER_SOFT_EDGE_WIDTH
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.npc_near_by: Optional[FriendlyNpc] = None
         self.talking: bool = False
-        self.inventory: List = []
+        # Count of collected items, by type.
+        self.inventory: Dict[EntityType, int] = {}
+        # Image of the first collected item of each type, shown as icon by PlayerInventory.
+        self.inventory_images: Dict[EntityType, Surface] = {}
         self.inventory_entity_id: Optional[int] = None
+        # Whether the PlayerInventory entity needs to be told about inventory changes.
+        self.is_inventory_changed: bool = True
 
         self.last_hit_t: int = pygame.time.get_ticks()
 
@@ -45,9 +66,13 @@ class Player(AnimatedEntity):
         """
         This Player entity directly manages a PlayerInventory entity.
         """
-        if not self.inventory_entity_id:
+        if self.inventory_entity_id is None:
             self.inventory_entity_id = self.world.add_entity(EntityType.PLAYER_INVENTORY)
-        self.world.get_entity(self.inventory_entity_id).set_inventory(self.inventory)
+        if self.is_inventory_changed:
+            self.world.get_entity(self.inventory_entity_id).set_inventory(
+                self.inventory, self.inventory_images
+            )
+            self.is_inventory_changed = False
 
     def _handle_events(self):
         """
@@ -84,7 +109,7 @@ class Player(AnimatedEntity):
     def _update_npc_near_by(self):
         self.npc_near_by = None
         for npc in self.world.get_friendly_npcs():
-            if self.collide(npc):
+            if npc.is_active() and self.collide(npc):
                 # Get a hold of the NPC, and post an event for that NPC to handle
                 self.npc_near_by = npc
                 GameEvent(EventType.PLAYER_NEAR_NPC, listener_id=npc.id).post()
@@ -93,22 +118,31 @@ class Player(AnimatedEntity):
     def _pick_item_near_by(self):
         """
         If Player collides with a collectable entity, remove that entity from World,
-        while adding that entity to the self.inventory list.
+        while counting that entity in self.inventory.
         """
-        for entity in self.world.get_collectable_tiles():
-            if self.collide(entity):
-                self.world.remove_entity(entity.id)
-                self.inventory.append(entity)
-                logger.info(f"Player picked up 1 {entity.entity_type}")
+        picked_entities = [
+            entity
+            for entity in self.world.get_collectable_tiles()
+            if entity.is_active() and self.collide(entity)
+        ]
+        # Remove after the loop above, since remove_entity() modifies the list being looped over.
+        for entity in picked_entities:
+            self.world.remove_entity(entity.id)
+            self.inventory[entity.entity_type] = self.inventory.get(entity.entity_type, 0) + 1
+            self.inventory_images.setdefault(entity.entity_type, entity.image)
+            self.is_inventory_changed = True
+            logger.info(f"Player picked up 1 {entity.entity_type}")
 
     def _update_screen_offset(self):
         """Logics for horizontal world scroll based on player movement"""
         delta_screen_offset = 0
 
-        at_right_edge = self.rect.right >= GameConfig.WIDTH
-        at_right_soft_edge = self.rect.right > GameConfig.WIDTH - GameConfig.PLAYER_SOFT_EDGE_WIDTH
-        at_left_edge = self.rect.left <= 0
-        at_left_soft_edge = self.rect.left < GameConfig.PLAYER_SOFT_EDGE_WIDTH
+        right = self.rect.right
+        left = self.rect.left
+        at_right_edge = right >= self.RIGHT_EDGE
+        at_right_soft_edge = right > self.RIGHT_SOFT_EDGE
+        at_left_edge = left <= 0
+        at_left_soft_edge = left < self.LEFT_SOFT_EDGE
 
         if (
             at_left_edge
@@ -1,22 +1,38 @@
-from collections import Counter
-from typing import List
+from typing import Dict
 
 import pygame
+from pygame.surface import Surface
 
 from common import util
+from common.types import EntityType
 from config import Color, PlayerInventoryConfig
 from entities.base_entity import BaseEntity
 
 
 class PlayerInventory(BaseEntity):
+    __slots__ = ("inventory", "icons")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.inventory: List = []
+        self.inventory: Dict[EntityType, int] = {}
+        # Scaled icon for each collected item type, loaded once.
+        self.icons: Dict[EntityType, Surface] = {}
         self.rect.centery = self.rect.y + PlayerInventoryConfig.TILE_SIZE // 2
 
-    def set_inventory(self, inventory: List):
-        """Set the backend data, called by Player."""
+    def set_inventory(
+        self, inventory: Dict[EntityType, int], images: Dict[EntityType, Surface]
+    ):
+        """
+        Set the backend data, called by Player whenever the inventory changes.
+        `images` holds the image of a collected item for each type, scaled here once into an icon.
+        """
         self.inventory = inventory
+        for entity_type in inventory:
+            if entity_type not in self.icons:
+                self.icons[entity_type] = util.scale_image(
+                    images[entity_type],
+                    (PlayerInventoryConfig.TILE_SIZE, PlayerInventoryConfig.TILE_SIZE),
+                )
 
     def render(
         self,
@@ -27,18 +43,11 @@ class PlayerInventory(BaseEntity):
         super().render(screen, *args, **kwargs)
 
         # Render the collected items, each with a count.
-        # This computation could be optimized more for performance.
-        counter = Counter([item.entity_type for item in self.inventory])
-        inventory_dict = {item.entity_type: item for item in self.inventory}
         x = PlayerInventoryConfig.X
         y = PlayerInventoryConfig.Y
-        for entity_type, cnt in counter.items():
+        for entity_type, cnt in self.inventory.items():
             x += PlayerInventoryConfig.X_STEP
-            inventory_dict[entity_type].render(
-                screen,
-                x_y=(x, y),
-                scale=(PlayerInventoryConfig.TILE_SIZE, PlayerInventoryConfig.TILE_SIZE),
-            )
+            screen.blit(self.icons[entity_type], (x, y))
             util.display_text(
                 screen,
                 text=str(cnt),
@@ -17,6 +17,8 @@ logger = logging.getLogger(__name__)
 class Shadow(AnimatedEntity):
     """Shadow entity haunting STEAM Valley."""
 
+    __slots__ = ("damage",)
+
     def __init__(self, damage, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.damage = damage
@@ -15,6 +15,8 @@ class TrampolinePart(BaseEntity):
     Trampoline parts that can be picked up to give to an NPC.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.set_active(False)
@@ -10,6 +10,7 @@ from common.types import (
     FIXED_POSITION_TYPES,
     FRIENDLY_NPC_TYPES,
     OBSTACLES_TYPES,
+    POOLED_TYPES,
     EntityType,
 )
 from common.util import get_logger
@@ -21,6 +22,38 @@ from worlds.base_world import BaseWorld
 logger = get_logger(__name__)
 
 
+class EntityPool:
+    """
+    Keeps removed entities of POOLED_TYPES so that World.add_entity() can hand them out again,
+    instead of creating a new entity (and loading its sprite from disk) every time.
+
+    This matters for entities that come and go many times during gameplay, such as the
+    question mark above an NPC, which is added / removed whenever Player walks by.
+    """
+
+    def __init__(self) -> None:
+        self.free_entities: Dict[EntityType, List[BaseEntity]] = {
+            entity_type: [] for entity_type in POOLED_TYPES
+        }
+
+    def acquire(self, entity_type: EntityType, x: int = 0, y: int = 0) -> BaseEntity:
+        free_entities = self.free_entities.get(entity_type)
+        if not free_entities:
+            return EntityFactory.create(entity_type=entity_type, x=x, y=y)
+
+        entity = free_entities.pop()
+        entity.created_at = pygame.time.get_ticks()
+        entity.set_active(True)
+        if entity_type not in FIXED_POSITION_TYPES:
+            entity.rect.x, entity.rect.y = x, y
+        return entity
+
+    def release(self, entity: BaseEntity) -> None:
+        free_entities = self.free_entities.get(entity.entity_type)
+        if free_entities is not None:
+            free_entities.append(entity)
+
+
 class World(BaseWorld):
     """The in-game world.
 
@@ -30,11 +63,24 @@ class World(BaseWorld):
     def __init__(self, screen: Surface, level_id: int) -> None:
         super().__init__(screen)
         self.entities: Dict[int, BaseEntity] = {}
+        # The subset of self.entities that has per-tick logic, see _needs_update().
+        # Static tiles (ground, walls, items...) are only rendered, not updated.
+        self.updatable_entities: Dict[int, BaseEntity] = {}
+        self.entity_pool = EntityPool()
+
+        # Entities grouped for specific game logics, kept up to date by add / remove_entity(),
+        # so that the get_*() helpers below do not need to scan all entities every tick.
+        self.obstacles: List[BaseEntity] = []
+        self.collectable_tiles: List[BaseEntity] = []
+        self.friendly_npcs: List[BaseEntity] = []
+
         self.abs_screen_offset = 0
         self.delta_screen_offset = 0
         self.background: Optional[Surface] = None
         self.event_handler: Optional[Callable] = None
         self.events: Optional[Sequence[GameEvent]] = None
+        # Events sent to specific entities, grouped by listener_id once every tick.
+        self.events_by_listener_id: Dict[int, List[GameEvent]] = {}
 
         # Will render the loading screen in ~1 second before the actual start of the level.
         self.is_loading = True
@@ -51,9 +97,6 @@ class World(BaseWorld):
         )
 
     def tick(self, events: Sequence[GameEvent]) -> bool:
-        if pygame.event.peek(pygame.QUIT):
-            return False
-
         if self.is_loading:
             self.loading_percent += LevelLoadingBarConfig.STEP
             util.draw_loading_bar(self.screen, self.loading_percent)
@@ -71,6 +114,11 @@ class World(BaseWorld):
 
     def update(self, events):
         self.events = events
+        self.events_by_listener_id = {}
+        for event in events:
+            listener_id = event.get_listener_id()
+            if listener_id is not None:
+                self.events_by_listener_id.setdefault(listener_id, []).append(event)
 
         if self.event_handler:
             self.event_handler(self)
@@ -79,13 +127,15 @@ class World(BaseWorld):
 
         # CAVEAT:
         # To avoid python error "RuntimeError: dictionary changed size during iteration",
-        # we snapshot the list of entity IDs with `list(self.entities)`.
+        # we snapshot the list of entity IDs with `list(self.updatable_entities)`.
         # And thus, if new entities are added during this loop, they will NOT
         # be picked up and process this turn. This could lead to bugs.
-        for entity_id in list(self.entities):
-            if entity_id not in self.entities:
+        updatable_entities = self.updatable_entities
+        for entity_id in list(updatable_entities):
+            entity = updatable_entities.get(entity_id)
+            if entity is None:
                 continue
-            self.entities[entity_id].update(events, self)
+            entity.update(events, self)
 
     def render(self, screen):
         """
@@ -114,10 +164,30 @@ class World(BaseWorld):
                 )
 
     def add_entity(self, entity_type: EntityType, x: int = 0, y: int = 0) -> int:
-        new_entity = EntityFactory.create(entity_type=entity_type, x=x, y=y)
+        new_entity = self.entity_pool.acquire(entity_type=entity_type, x=x, y=y)
         self.entities[new_entity.id] = new_entity
+        new_entity.world = self
+        if self._needs_update(new_entity):
+            self.updatable_entities[new_entity.id] = new_entity
+        entity_group = self._get_entity_group(entity_type)
+        if entity_group is not None:
+            entity_group.append(new_entity)
         return new_entity.id
 
+    def set_updatable(self, entity: BaseEntity) -> None:
+        """
+        Makes sure update() of the given entity is called every tick from now on,
+        eg. after a TTL is set on a static tile with entity.set_remaining_ttl_ms().
+        """
+        if entity.id in self.entities:
+            self.updatable_entities[entity.id] = entity
+
+    def get_events_for(self, listener_id: int) -> Sequence[GameEvent]:
+        """
+        Returns this tick's events sent specifically to the given entity, ie. with that listener_id.
+        """
+        return self.events_by_listener_id.get(listener_id, ())
+
     def get_entity(self, entity_id: int) -> BaseEntity:
         return self.entities[entity_id]
 
@@ -135,7 +205,29 @@ class World(BaseWorld):
         return None
 
     def remove_entity(self, entity_id: int):
-        del self.entities[entity_id]
+        entity = self.entities.pop(entity_id)
+        self.updatable_entities.pop(entity_id, None)
+        entity_group = self._get_entity_group(entity.entity_type)
+        if entity_group is not None:
+            entity_group.remove(entity)
+        self.entity_pool.release(entity)
+
+    @staticmethod
+    def _needs_update(entity: BaseEntity) -> bool:
+        """
+        A plain BaseEntity without TTL does nothing in update(), so there is no need to call it.
+        If a TTL is set later on, BaseEntity.set_remaining_ttl_ms() calls set_updatable().
+        """
+        return type(entity).update is not BaseEntity.update or entity.ttl_ms is not None
+
+    def _get_entity_group(self, entity_type: EntityType) -> Optional[List[BaseEntity]]:
+        if entity_type in OBSTACLES_TYPES:
+            return self.obstacles
+        if entity_type in COLLECTABLE_TYPES:
+            return self.collectable_tiles
+        if entity_type in FRIENDLY_NPC_TYPES:
+            return self.friendly_npcs
+        return None
 
     def load_level(self, level_id):
         data = WorldData(level_id=level_id)
@@ -170,26 +262,18 @@ class World(BaseWorld):
     # BELOW are helper functions to select only related entities for specific game logics.
     # Most game logics involve interactions between Player and some entities, so these helper
     # functions are likely being called in Player code.
+    #
+    # They return the World's own lists without copying, so:
+    # - the lists may contain inactive entities, callers should check entity.is_active(),
+    # - callers must not modify the lists, or call remove_entity() while looping over them.
     def get_obstacles(self) -> List[BaseEntity]:
-        return [
-            entity
-            for entity in self.entities.values()
-            if entity.is_active() and entity.entity_type in OBSTACLES_TYPES
-        ]
+        return self.obstacles
 
     def get_collectable_tiles(self) -> List[BaseEntity]:
-        return [
-            entity
-            for entity in self.entities.values()
-            if entity.is_active() and entity.entity_type in COLLECTABLE_TYPES
-        ]
+        return self.collectable_tiles
 
     def get_friendly_npcs(self) -> List[BaseEntity]:
-        return [
-            entity
-            for entity in self.entities.values()
-            if entity.is_active() and entity.entity_type in FRIENDLY_NPC_TYPES
-        ]
+        return self.friendly_npcs
 
     def get_entities(
         self, entity_types: Union[EntityType, Iterable[EntityType]]
@@ -23,10 +23,7 @@ class WorldManager:
         self.active_world = self.WORLD_MENU
 
     def tick(self) -> bool:
-        if pygame.event.peek(pygame.QUIT):
-            return False
-
-        # Get all events from the Event queue
+        # Get all events from the Event queue, this is the only place we read the queue.
         pg_events = pygame.event.get()
 
         # We want a nicer interface that works with both pygame native event types and
@@ -36,7 +33,9 @@ class WorldManager:
 
         # Process generic game events first
         for e in events:
-            if e.is_type(EventType.START_GAME):
+            if e.is_type(pygame.QUIT):
+                return False
+            elif e.is_type(EventType.START_GAME):
                 self.start_or_resume_game(level_id=e.event.level_id, force_start=True)
             elif e.is_type(EventType.RESTART_LEVEL):
                 self.start_or_resume_game(level_id=self.level_id, force_start=True)